@@ -0,0 +1,7 @@
+"""
+Paramètres partagés entre l'API et le dashboard (sans effet de bord à l'import)
+Projet MLOps - Prêt à dépenser
+"""
+
+# Seuil de décision (dummy, sera 0.10 en production)
+THRESHOLD = 0.5
@@ -4,14 +4,21 @@ API de scoring de crédit - Version Dummy
 Projet MLOps - Prêt à dépenser
 """
 
+import asyncio
 import json
+import os
 import random
+import secrets
 from pathlib import Path
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 import csv
-from datetime import datetime
+from datetime import date, datetime
 from time import time
+from api.config import THRESHOLD
+from api.profiling import collect_allocation_top, collect_stack_samples, format_collapsed
+from api.score_histogram import ScoreHistogram
 
 # Création de l'application FastAPI
 app = FastAPI(
@@ -28,8 +35,11 @@ with open(CLIENTS_FILE, "r") as f:
 
 print(f"✅ Base clients chargée : {len(clients_db)} clients disponibles")
 
-# Fichier de logs pour la production
-LOGS_FILE = Path(__file__).parent.parent / "data" / "prod" / "logs_production.csv"
+# Fichier de logs pour la production (surchargeable via la variable d'environnement LOGS_FILE)
+LOGS_FILE = Path(os.environ.get(
+    "LOGS_FILE",
+    Path(__file__).parent.parent / "data" / "prod" / "logs_production.csv"
+))
 
 # Créer le fichier avec en-têtes s'il n'existe pas
 if not LOGS_FILE.exists():
@@ -46,6 +56,10 @@ if not LOGS_FILE.exists():
 else:
     print(f"✅ Fichier de logs existant : {LOGS_FILE}")
 
+# Histogramme des scores, tenu à jour en relisant seulement la fin du log
+HISTOGRAM_FILE = LOGS_FILE.parent / "score_histogram.json"
+score_histogram = ScoreHistogram.load_synced(HISTOGRAM_FILE, LOGS_FILE)
+
 # Modèle de sortie de la prédiction
 class PredictionOut(BaseModel):
     client_id: str
@@ -79,9 +93,6 @@ def dummy_model_predict(client_id: str, features: dict) -> float:
     
     return round(score, 2)
 
-# Seuil de décision (dummy, sera 0.10 en production)
-THRESHOLD = 0.5
-
 def log_prediction(client_id: str, score: float, decision: str, response_time: float):
     """
     Enregistre une prédiction dans le fichier de logs CSV
@@ -159,4 +170,128 @@ async def root():
         "message": "API Scoring Crédit - Version Dummy",
         "status": "operational",
         "clients_disponibles": len(clients_db)
-    }
\ No newline at end of file
+    }
+
+@app.get("/stats/acceptance")
+def acceptance_stats(
+    threshold: float = Query(THRESHOLD, ge=0, le=1),
+    start: date = None,
+    end: date = None
+):
+    """
+    Simulation du taux d'acceptation pour un seuil donné sur l'historique des logs
+
+    Args:
+        threshold: Seuil de décision à simuler (résolution 0.01)
+        start: Premier jour inclus (optionnel)
+        end: Dernier jour inclus (optionnel)
+
+    Returns:
+        dict: Seuil appliqué, nombre de prédictions, acceptations, refus et taux d'acceptation
+    """
+    # Lecture/écriture de fichiers : route synchrone, exécutée dans le threadpool
+    # Intègre uniquement les lignes ajoutées au log depuis la dernière requête
+    if score_histogram.sync(LOGS_FILE):
+        score_histogram.save(HISTOGRAM_FILE)
+
+    return {
+        "start": start,
+        "end": end,
+        **score_histogram.acceptance(threshold, start, end)
+    }
+
+# ============================================================
+# PROFILAGE À CHAUD (ADMIN)
+# ============================================================
+
+# Désactivé par défaut : à activer explicitement via variables d'environnement
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "0") == "1"
+PROFILING_TOKEN = os.environ.get("PROFILING_TOKEN", "")
+
+# Plafonds de coût d'une session de profilage
+PROFILING_MAX_SECONDS = 30
+PROFILING_MIN_INTERVAL_MS = 1
+PROFILING_MAX_DEPTH = 64
+PROFILING_MAX_TOP_N = 100
+
+# Une seule session à la fois sur le process
+profiling_lock = asyncio.Lock()
+
+def check_profiling_access(admin_token: str):
+    """
+    Vérifie que le profilage est activé et que le jeton admin est valide
+
+    Args:
+        admin_token: Valeur de l'en-tête X-Admin-Token
+
+    Raises:
+        HTTPException 404: Si le profilage est désactivé
+        HTTPException 403: Si le jeton est absent ou invalide
+        HTTPException 409: Si une session est déjà en cours
+    """
+    if not PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    if not PROFILING_TOKEN or not secrets.compare_digest(
+        admin_token.encode(), PROFILING_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Jeton administrateur invalide")
+
+    if profiling_lock.locked():
+        raise HTTPException(status_code=409, detail="Une session de profilage est déjà en cours")
+
+@app.get("/admin/profile/cpu", response_class=PlainTextResponse, include_in_schema=False)
+async def profile_cpu(
+    duration_s: float = Query(5.0, gt=0, le=PROFILING_MAX_SECONDS),
+    interval_ms: float = Query(10.0, ge=PROFILING_MIN_INTERVAL_MS, le=1000),
+    x_admin_token: str = Header("")
+):
+    """
+    Profilage CPU statistique du process en cours d'exécution
+
+    Args:
+        duration_s: Durée de la session (plafonnée à PROFILING_MAX_SECONDS)
+        interval_ms: Intervalle d'échantillonnage en millisecondes
+        x_admin_token: Jeton administrateur (en-tête X-Admin-Token)
+
+    Returns:
+        PlainTextResponse: Piles au format collapsed (flamegraph)
+    """
+    check_profiling_access(x_admin_token)
+
+    async with profiling_lock:
+        counts = await asyncio.to_thread(
+            collect_stack_samples, duration_s, interval_ms / 1000, PROFILING_MAX_DEPTH
+        )
+
+    return PlainTextResponse(
+        format_collapsed(counts),
+        headers={"Content-Disposition": 'attachment; filename="profile.collapsed"'}
+    )
+
+@app.get("/admin/profile/memory", include_in_schema=False)
+async def profile_memory(
+    duration_s: float = Query(5.0, ge=0, le=PROFILING_MAX_SECONDS),
+    top_n: int = Query(20, ge=1, le=PROFILING_MAX_TOP_N),
+    x_admin_token: str = Header("")
+):
+    """
+    Snapshot des allocations mémoire (tracemalloc top-N)
+
+    Args:
+        duration_s: Durée d'observation (plafonnée à PROFILING_MAX_SECONDS)
+        top_n: Nombre de lignes à retourner
+        x_admin_token: Jeton administrateur (en-tête X-Admin-Token)
+
+    Returns:
+        dict: Lignes de code qui allouent le plus
+    """
+    check_profiling_access(x_admin_token)
+
+    async with profiling_lock:
+        top = await asyncio.to_thread(collect_allocation_top, duration_s, top_n)
+
+    return {
+        "duration_s": duration_s,
+        "top_allocations": top
+    }
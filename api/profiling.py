@@ -0,0 +1,99 @@
+"""
+Outils de profilage à chaud de l'API (échantillonnage CPU + allocations)
+Projet MLOps - Prêt à dépenser
+"""
+
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from time import monotonic, sleep
+
+
+def collect_stack_samples(duration_s: float, interval_s: float, max_depth: int) -> Counter:
+    """
+    Profilage statistique : relève périodiquement la pile de chaque thread
+
+    Le thread qui échantillonne s'exclut lui-même des relevés. Le coût est
+    borné par la durée, l'intervalle et la profondeur maximale des piles.
+
+    Args:
+        duration_s: Durée de la session en secondes
+        interval_s: Intervalle entre deux relevés en secondes
+        max_depth: Nombre maximum de frames conservées par pile
+
+    Returns:
+        Counter: Nombre d'occurrences de chaque pile (tuple racine -> feuille)
+    """
+    own_thread = threading.get_ident()
+    counts = Counter()
+    deadline = monotonic() + duration_s
+
+    while monotonic() < deadline:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            stack = []
+            while frame is not None and len(stack) < max_depth:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+            counts[tuple(reversed(stack))] += 1
+        sleep(interval_s)
+
+    return counts
+
+
+def format_collapsed(counts: Counter) -> str:
+    """
+    Met les piles au format "collapsed" (une ligne "f1;f2;f3 N" par pile),
+    directement utilisable par flamegraph.pl ou speedscope
+
+    Args:
+        counts: Piles échantillonnées et leur nombre d'occurrences
+
+    Returns:
+        str: Contenu du fichier collapsed
+    """
+    lines = [f"{';'.join(stack)} {count}" for stack, count in counts.most_common()]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def collect_allocation_top(duration_s: float, top_n: int) -> list:
+    """
+    Snapshot tracemalloc des N lignes de code qui allouent le plus
+
+    Si tracemalloc est déjà actif, il n'est ni redémarré ni arrêté.
+
+    Args:
+        duration_s: Durée d'observation en secondes
+        top_n: Nombre de lignes à retourner
+
+    Returns:
+        list: Statistiques par ligne (fichier, ligne, taille, nombre de blocs)
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+
+    try:
+        sleep(duration_s)
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    stats = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]).statistics("lineno")
+
+    return [
+        {
+            "file": stat.traceback[0].filename,
+            "line": stat.traceback[0].lineno,
+            "size_kb": round(stat.size / 1024, 2),
+            "count": stat.count
+        }
+        for stat in stats[:top_n]
+    ]
@@ -0,0 +1,283 @@
+"""
+Histogramme cumulatif des scores, maintenu au fil des logs de production
+Projet MLOps - Prêt à dépenser
+"""
+
+import csv
+import io
+import json
+import math
+import os
+import tempfile
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from pathlib import Path
+
+# Nombre de classes sur [0, 1[ : résolution du seuil = 1 / NB_BINS
+# Une classe supplémentaire reçoit les scores >= 1 (refusés même au seuil 1)
+NB_BINS = 100
+
+
+def score_to_bin(score: float) -> int:
+    """
+    Classe d'un score : [0.00, 0.01[ -> 0, ..., [0.99, 1.00[ -> 99, 1.00 -> 100
+
+    Args:
+        score: Score entre 0 et 1
+
+    Returns:
+        int: Indice de la classe
+    """
+    # Tolérance pour les flottants (0.29 * 100 = 28.999999999999996)
+    return min(max(math.floor(score * NB_BINS + 1e-9), 0), NB_BINS)
+
+
+class ScoreHistogram:
+    """
+    Compte des scores par jour et par classe, dérivé du fichier de logs
+
+    L'histogramme mémorise la position (en octets) jusqu'à laquelle le log a
+    été lu : sync() ne relit que la fin du fichier. La première ligne de
+    données sert de marqueur pour détecter un log remplacé ou supprimé.
+
+    Les requêtes (seuil, fenêtre de dates) passent par des sommes cumulées
+    dans le temps puis dans les classes : O(NB_BINS) par requête.
+
+    Les lignes illisibles du log (écriture interrompue...) sont ignorées et
+    comptées dans skipped_rows.
+    """
+
+    def __init__(self, days: dict = None, log_offset: int = 0, log_head: str = "", skipped_rows: int = 0):
+        # {"2025-10-10": [compte classe 0, ..., compte classe 100]}
+        self.days = days or {}
+        self.log_offset = log_offset
+        self.log_head = log_head
+        self.skipped_rows = skipped_rows
+        self._prefix = None
+        # sync(), save() et counts() peuvent être appelés depuis plusieurs threads
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """
+        Vide l'histogramme (le prochain sync() relit tout le log)
+        """
+        self.days = {}
+        self.log_offset = 0
+        self.log_head = ""
+        self.skipped_rows = 0
+        self._prefix = None
+
+    def add(self, timestamp: datetime, score: float):
+        """
+        Ajoute une prédiction à l'histogramme
+
+        Args:
+            timestamp: Date/heure de la prédiction
+            score: Score de prédiction
+        """
+        day = timestamp.date().isoformat()
+        if day not in self.days:
+            self.days[day] = [0] * (NB_BINS + 1)
+        self.days[day][score_to_bin(score)] += 1
+        self._prefix = None
+
+    def sync(self, logs_file: Path) -> bool:
+        """
+        Intègre les lignes ajoutées au log depuis la dernière synchronisation
+
+        Reconstruit tout si le log a été tronqué, remplacé ou supprimé.
+
+        Args:
+            logs_file: Fichier CSV des logs de production
+
+        Returns:
+            bool: True si l'histogramme a changé
+        """
+        with self._lock:
+            return self._sync(logs_file)
+
+    def _sync(self, logs_file: Path) -> bool:
+        """
+        Corps de sync(), appelé avec le verrou pris
+        """
+        if not logs_file.exists():
+            changed = self.log_offset > 0
+            self.reset()
+            return changed
+
+        changed = False
+        with open(logs_file, "rb") as f:
+            header = f.readline()
+            first_row = f.readline()
+            head = first_row.decode("utf-8", errors="replace") if first_row.endswith(b"\n") else ""
+            size = f.seek(0, os.SEEK_END)
+
+            # Marqueur de cohérence : même début de fichier et pas de troncature
+            if self.log_offset and (size < self.log_offset or (self.log_head and head != self.log_head)):
+                self.reset()
+                changed = True
+
+            if self.log_offset == 0:
+                self.log_offset = len(header)
+            self.log_head = head
+
+            f.seek(self.log_offset)
+            tail = f.read()
+
+        # Ne traiter que les lignes complètes (une écriture peut être en cours)
+        complete = tail[:tail.rfind(b"\n") + 1]
+        if not complete:
+            return changed
+
+        fieldnames = next(csv.reader([header.decode("utf-8", errors="replace")]))
+        text = complete.decode("utf-8", errors="replace")
+        skipped = 0
+        for row in csv.DictReader(io.StringIO(text, newline=""), fieldnames=fieldnames):
+            try:
+                timestamp = datetime.fromisoformat(row["timestamp"])
+                score = float(row["score"])
+            except (ValueError, KeyError, TypeError):
+                skipped += 1
+                continue
+            self.add(timestamp, score)
+        self.log_offset += len(complete)
+
+        if skipped:
+            self.skipped_rows += skipped
+            print(f"⚠️ Histogramme des scores : {skipped} ligne(s) illisible(s) ignorée(s) dans {logs_file}")
+
+        return True
+
+    def _build_prefix(self):
+        """
+        Calcule les histogrammes cumulés jour après jour (une fois par mise à jour)
+        """
+        sorted_days = sorted(self.days)
+        cumulative = [[0] * (NB_BINS + 1)]
+        for day in sorted_days:
+            previous = cumulative[-1]
+            cumulative.append([a + b for a, b in zip(previous, self.days[day])])
+        self._prefix = (sorted_days, cumulative)
+
+    def counts(self, start: date = None, end: date = None) -> list:
+        """
+        Comptes par classe sur une fenêtre de dates (bornes incluses)
+
+        Args:
+            start: Premier jour inclus (None = depuis le début)
+            end: Dernier jour inclus (None = jusqu'à aujourd'hui)
+
+        Returns:
+            list: NB_BINS + 1 comptes
+        """
+        with self._lock:
+            if self._prefix is None:
+                self._build_prefix()
+            sorted_days, cumulative = self._prefix
+
+        lo = bisect_left(sorted_days, start.isoformat()) if start else 0
+        hi = bisect_right(sorted_days, end.isoformat()) if end else len(sorted_days)
+        if hi <= lo:
+            return [0] * (NB_BINS + 1)
+        return [b - a for a, b in zip(cumulative[lo], cumulative[hi])]
+
+    def acceptance(self, threshold: float, start: date = None, end: date = None) -> dict:
+        """
+        Taux d'acceptation pour un seuil donné (accepté si score < seuil)
+
+        Args:
+            threshold: Seuil de décision, arrondi à la résolution 1 / NB_BINS
+            start: Premier jour inclus
+            end: Dernier jour inclus
+
+        Returns:
+            dict: seuil appliqué, total, nb_acceptes, nb_refuses, taux_acceptation (en %)
+        """
+        counts = self.counts(start, end)
+        cut = min(max(round(threshold * NB_BINS), 0), NB_BINS)
+        total = sum(counts)
+        nb_acceptes = sum(counts[:cut])
+
+        return {
+            "threshold": cut / NB_BINS,
+            "total": total,
+            "nb_acceptes": nb_acceptes,
+            "nb_refuses": total - nb_acceptes,
+            "taux_acceptation": round(nb_acceptes / total * 100, 2) if total else 0.0
+        }
+
+    def save(self, path: Path):
+        """
+        Sauvegarde l'histogramme en JSON (remplacement atomique)
+
+        Args:
+            path: Chemin du fichier JSON
+        """
+        # Fichier temporaire unique : l'API et le dashboard peuvent écrire en même temps
+        with self._lock, tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as f:
+            json.dump({
+                "nb_bins": NB_BINS,
+                "log_offset": self.log_offset,
+                "log_head": self.log_head,
+                "skipped_rows": self.skipped_rows,
+                "days": self.days
+            }, f)
+        Path(f.name).replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "ScoreHistogram":
+        """
+        Charge un histogramme sauvegardé
+
+        Args:
+            path: Chemin du fichier JSON
+
+        Returns:
+            ScoreHistogram: Histogramme chargé
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("nb_bins") != NB_BINS:
+            raise ValueError(f"Histogramme incompatible : {data.get('nb_bins')} classes au lieu de {NB_BINS}")
+        return cls(data["days"], data["log_offset"], data["log_head"], data.get("skipped_rows", 0))
+
+    @classmethod
+    def from_logs(cls, logs_file: Path) -> "ScoreHistogram":
+        """
+        Reconstruit l'histogramme en relisant tout le fichier de logs
+
+        Args:
+            logs_file: Fichier CSV des logs de production
+
+        Returns:
+            ScoreHistogram: Histogramme reconstruit
+        """
+        histogram = cls()
+        histogram.sync(logs_file)
+        return histogram
+
+    @classmethod
+    def load_synced(cls, path: Path, logs_file: Path) -> "ScoreHistogram":
+        """
+        Charge l'histogramme (ou le reconstruit) puis le met à jour avec la fin du log
+
+        Args:
+            path: Chemin du fichier JSON
+            logs_file: Fichier CSV des logs de production
+
+        Returns:
+            ScoreHistogram: Histogramme à jour
+        """
+        try:
+            histogram = cls.load(path)
+            changed = False
+        except (OSError, ValueError, KeyError):
+            histogram = cls()
+            changed = True
+
+        if histogram.sync(logs_file) or changed:
+            histogram.save(path)
+        return histogram
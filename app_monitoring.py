@@ -7,11 +7,11 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 from pathlib import Path
-from evidently import Report
-from evidently.metrics import *
-from evidently.presets import *
 import numpy as np
 import requests
+from api.config import THRESHOLD
+from api.score_histogram import NB_BINS, ScoreHistogram
+from monitoring import generate_drift_report, load_logs
 
 # Configuration de la page
 st.set_page_config(
@@ -30,6 +30,9 @@ API_URL = "http://localhost:8000/predict"
 # Chemin vers le fichier de logs
 LOGS_FILE = Path("data/prod/logs_production.csv")
 
+# Histogramme des scores maintenu par l'API à côté des logs
+HISTOGRAM_FILE = LOGS_FILE.parent / "score_histogram.json"
+
 # Fonction pour charger les données
 @st.cache_data
 def load_data():
@@ -39,46 +42,29 @@ def load_data():
     Returns:
         pd.DataFrame: Données des prédictions
     """
-    if LOGS_FILE.exists():
-        df = pd.read_csv(LOGS_FILE)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        return df
-    else:
-        return None
+    return load_logs(LOGS_FILE)
 
-def generate_drift_report(df_production):
+@st.cache_resource
+def load_histogram():
     """
-    Génère un rapport de drift entre référence et production
+    Charge l'histogramme des scores (une fois par process Streamlit)
     
-    Args:
-        df_production: DataFrame des logs de production
-        
     Returns:
-        tuple: (rapport Evidently, chemin HTML)
+        ScoreHistogram: Histogramme des scores par jour
     """
-    # Créer un dataset de référence simulé (même logique que le notebook)
-    np.random.seed(42)
-    scores_reference = []
-    
-    for _ in range(100):
-        if np.random.random() < 0.85:
-            score = np.random.uniform(0.70, 0.95)
-        else:
-            score = np.random.uniform(0.10, 0.69)
-        scores_reference.append(score)
-    
-    reference_data = pd.DataFrame({'score': scores_reference})
-    current_data = df_production[['score']].copy()
-    
-    # Générer le rapport
-    report = Report([DataDriftPreset()])
-    my_eval = report.run(current_data=current_data, reference_data=reference_data)
-    
-    # Sauvegarder le rapport HTML temporaire
-    html_path = Path("drift_report_temp.html")
-    my_eval.save_html(str(html_path))
+    return ScoreHistogram.load_synced(HISTOGRAM_FILE, LOGS_FILE)
+
+def get_histogram():
+    """
+    Histogramme à jour : relit seulement la fin du log à chaque rafraîchissement
     
-    return my_eval, html_path
+    Returns:
+        ScoreHistogram: Histogramme des scores par jour
+    """
+    histogram = load_histogram()
+    if histogram.sync(LOGS_FILE):
+        histogram.save(HISTOGRAM_FILE)
+    return histogram
 
 # ============================================================
 # PAGE 0 : DÉMO INTERACTIVE - TEST DU MODÈLE
@@ -142,7 +128,7 @@ if predict_button:
                         )
                     
                     # Message d'explication
-                    st.caption(f"💡 Score : {data['score']:.2f} (Seuil de décision : 0.5)")
+                    st.caption(f"💡 Score : {data['score']:.2f} (Seuil de décision : {THRESHOLD})")
                     
                 elif response.status_code == 404:
                     st.error(f"❌ Client {client_id} introuvable dans la base de données")
@@ -215,6 +201,82 @@ with col3:
 
 st.markdown("---")
 
+# ============================================================
+# PAGE 1 BIS : SIMULATION DU SEUIL DE DÉCISION
+# ============================================================
+
+st.header("🎚️ Simulation du seuil de décision")
+
+st.info("💡 Simulez l'impact d'un autre seuil sur le taux d'acceptation (crédit accepté si score < seuil).")
+
+histogram = get_histogram()
+jours = sorted(histogram.days)
+
+col1, col2 = st.columns(2)
+
+with col1:
+    seuil = st.slider(
+        "Seuil de décision",
+        min_value=0.0,
+        max_value=1.0,
+        value=THRESHOLD,
+        step=1 / NB_BINS
+    )
+
+with col2:
+    periode = st.date_input(
+        "Période analysée",
+        value=(pd.Timestamp(jours[0]).date(), pd.Timestamp(jours[-1]).date())
+    )
+
+# La sélection d'une période peut être en cours (une seule date choisie)
+debut, fin = (periode[0], periode[-1]) if len(periode) else (None, None)
+simulation = histogram.acceptance(seuil, debut, fin)
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric(
+        label="📊 Prédictions sur la période",
+        value=f"{simulation['total']}"
+    )
+
+with col2:
+    st.metric(
+        label="✅ Crédits acceptés",
+        value=f"{simulation['nb_acceptes']}",
+        delta=f"{simulation['taux_acceptation']:.1f}%"
+    )
+
+with col3:
+    st.metric(
+        label="❌ Crédits refusés",
+        value=f"{simulation['nb_refuses']}",
+        delta=f"{100 - simulation['taux_acceptation']:.1f}%" if simulation['total'] else None
+    )
+
+# Courbe taux d'acceptation / seuil : une somme cumulée sur les classes
+comptes = np.array(histogram.counts(debut, fin))
+if comptes.sum() > 0:
+    courbe = pd.DataFrame({
+        'seuil': np.arange(NB_BINS + 1) / NB_BINS,
+        'taux_acceptation': np.concatenate([[0], np.cumsum(comptes)])[:NB_BINS + 1] / comptes.sum() * 100
+    })
+    
+    fig_seuil = px.line(
+        courbe,
+        x='seuil',
+        y='taux_acceptation',
+        title="Taux d'acceptation selon le seuil",
+        labels={'seuil': 'Seuil de décision', 'taux_acceptation': "Taux d'acceptation (%)"}
+    )
+    
+    fig_seuil.add_vline(x=seuil, line_dash="dash", line_color="red")
+    fig_seuil.update_layout(height=400)
+    st.plotly_chart(fig_seuil, use_container_width=True)
+
+st.markdown("---")
+
 # ============================================================
 # PAGE 2 : DISTRIBUTION DES SCORES
 # ============================================================
@@ -0,0 +1,62 @@
+"""
+Fonctions de monitoring partagées (chargement des logs, data drift)
+Projet MLOps - Prêt à dépenser
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from evidently import Report
+from evidently.presets import DataDriftPreset
+
+
+def load_logs(logs_file: Path):
+    """
+    Charge les données de logs de production
+
+    Args:
+        logs_file: Fichier CSV des logs de production
+
+    Returns:
+        pd.DataFrame: Données des prédictions (None si le fichier n'existe pas)
+    """
+    if logs_file.exists():
+        df = pd.read_csv(logs_file)
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        return df
+    else:
+        return None
+
+def generate_drift_report(df_production, html_path: Path = Path("drift_report_temp.html")):
+    """
+    Génère un rapport de drift entre référence et production
+
+    Args:
+        df_production: DataFrame des logs de production
+        html_path: Chemin du rapport HTML généré
+
+    Returns:
+        tuple: (rapport Evidently, chemin HTML)
+    """
+    # Créer un dataset de référence simulé (même logique que le notebook)
+    np.random.seed(42)
+    scores_reference = []
+
+    for _ in range(100):
+        if np.random.random() < 0.85:
+            score = np.random.uniform(0.70, 0.95)
+        else:
+            score = np.random.uniform(0.10, 0.69)
+        scores_reference.append(score)
+
+    reference_data = pd.DataFrame({'score': scores_reference})
+    current_data = df_production[['score']].copy()
+
+    # Générer le rapport
+    report = Report([DataDriftPreset()])
+    my_eval = report.run(current_data=current_data, reference_data=reference_data)
+
+    # Sauvegarder le rapport HTML temporaire
+    my_eval.save_html(str(html_path))
+
+    return my_eval, html_path
@@ -0,0 +1,213 @@
+# tests/benchmarks/conftest.py
+"""
+Fixtures de benchmark (API inspirée de pytest-benchmark) et données synthétiques
+Projet MLOps - Prêt à dépenser
+
+Variables d'environnement :
+- BENCH_ROWS : taille du log synthétique du dashboard (défaut 1 000 000)
+- BENCH_BATCH : taille des lots de prédictions / d'écritures de logs (défaut 1 000)
+- BENCH_DRIFT_ROWS : taille du jeu de production pour le drift (défaut 100 000)
+- BENCH_COLD_START_ROWS : taille du log relu au démarrage à froid (défaut 10 000)
+- BENCH_TOLERANCE : ralentissement toléré vs baseline (défaut 0.30 = +30 %)
+- BENCH_SAVE=1 : enregistre les mesures comme nouvelles baselines
+
+Les baselines sont exprimées en multiples d'une boucle de calibration
+exécutée avant chaque tour, sur la même machine et dans les mêmes
+conditions de charge : elles restent comparables d'une machine à l'autre. Un benchmark sans baseline est signalé comme "skipped".
+"""
+
+import json
+import os
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+import pytest
+
+BASELINES_FILE = Path(__file__).parent / "baselines.json"
+
+BENCH_ROWS = int(os.environ.get("BENCH_ROWS", 1_000_000))
+BENCH_BATCH = int(os.environ.get("BENCH_BATCH", 1_000))
+BENCH_DRIFT_ROWS = int(os.environ.get("BENCH_DRIFT_ROWS", 100_000))
+BENCH_COLD_START_ROWS = int(os.environ.get("BENCH_COLD_START_ROWS", 10_000))
+BENCH_TOLERANCE = float(os.environ.get("BENCH_TOLERANCE", 0.30))
+BENCH_SAVE = os.environ.get("BENCH_SAVE", "0") == "1"
+
+
+def pytest_collection_modifyitems(items):
+    # Tous les tests de ce dossier sont des benchmarks, exclus par défaut (addopts)
+    for item in items:
+        if Path(__file__).parent in item.path.parents:
+            item.add_marker(pytest.mark.benchmark)
+
+
+def make_synthetic_logs(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Génère un log de production synthétique (même schéma que logs_production.csv)
+
+    Args:
+        n_rows: Nombre de prédictions
+        seed: Graine pour la reproductibilité
+
+    Returns:
+        pd.DataFrame: Log synthétique
+    """
+    rng = np.random.default_rng(seed)
+
+    # Même distribution que le modèle dummy : 90 % bons payeurs
+    good = rng.random(n_rows) < 0.90
+    scores = np.where(good, rng.uniform(0.70, 0.95, n_rows), rng.uniform(0.10, 0.69, n_rows)).round(2)
+
+    # Horodatages ISO (comme datetime.isoformat()) répartis sur 30 jours
+    offsets = np.sort(rng.integers(0, 30 * 24 * 3600 * 10**6, n_rows))
+    timestamps = pd.Timestamp("2025-10-01") + pd.to_timedelta(offsets, unit="us")
+
+    return pd.DataFrame({
+        "timestamp": timestamps.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+        "client_id": rng.integers(100001, 100011, n_rows),
+        "score": scores,
+        "decision": np.where(scores >= 0.5, "Crédit refusé", "Crédit accepté"),
+        "response_time_ms": rng.gamma(2.0, 0.5, n_rows).round(2)
+    })
+
+
+@pytest.fixture(scope="session")
+def bench_batch():
+    """
+    Taille des lots de prédictions et d'écritures de logs
+    """
+    return BENCH_BATCH
+
+
+@pytest.fixture(scope="session")
+def synthetic_logs_file(tmp_path_factory):
+    """
+    Fichier CSV de BENCH_ROWS prédictions synthétiques (généré une fois par session)
+    """
+    path = tmp_path_factory.mktemp("bench") / "logs_production.csv"
+    make_synthetic_logs(BENCH_ROWS).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(scope="session")
+def cold_start_logs_file(tmp_path_factory):
+    """
+    Fichier CSV de BENCH_COLD_START_ROWS prédictions relu au démarrage de l'API
+    """
+    path = tmp_path_factory.mktemp("bench_cold_start") / "logs_production.csv"
+    make_synthetic_logs(BENCH_COLD_START_ROWS, seed=3).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(scope="session")
+def synthetic_drift_data():
+    """
+    Jeu de production synthétique de BENCH_DRIFT_ROWS lignes pour le drift
+    """
+    return make_synthetic_logs(BENCH_DRIFT_ROWS, seed=7)
+
+
+def calibration_loop():
+    """
+    Charge CPU de référence (Python pur) servant d'unité de temps
+    """
+    total = 0
+    for i in range(200_000):
+        total += i * i % 7
+    return total
+
+
+@pytest.fixture(scope="session")
+def bench_results():
+    """
+    Mesures de la session, enregistrées comme baselines si BENCH_SAVE=1
+    """
+    results = {}
+    yield results
+
+    if BENCH_SAVE and results:
+        baselines = json.loads(BASELINES_FILE.read_text()) if BASELINES_FILE.exists() else {}
+        baselines.update(results)
+        BASELINES_FILE.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+
+class Benchmark:
+    """
+    Chronomètre une fonction et compare le meilleur tour (en unités de calibration)
+    à la baseline enregistrée
+    """
+
+    def __init__(self, name: str, results: dict):
+        self.name = name
+        self.results = results
+        self.baselines = json.loads(BASELINES_FILE.read_text()) if BASELINES_FILE.exists() else {}
+
+    def __call__(self, func, *args, **kwargs):
+        return self.pedantic(func, args=args, kwargs=kwargs)
+
+    def pedantic(self, func, args=(), kwargs=None, setup=None, rounds: int = 5, warmup_rounds: int = 1):
+        """
+        Exécute func sur plusieurs tours et vérifie la non-régression
+
+        Args:
+            func: Fonction à mesurer
+            args: Arguments positionnels
+            kwargs: Arguments nommés
+            setup: Fonction appelée avant chaque tour (non chronométrée)
+            rounds: Nombre de tours chronométrés
+            warmup_rounds: Nombre de tours d'échauffement
+
+        Returns:
+            Résultat du dernier appel à func
+        """
+        kwargs = kwargs or {}
+        timings = []
+        calibrations = []
+
+        for i in range(warmup_rounds + rounds):
+            if setup is not None:
+                setup()
+
+            # Calibration juste avant le tour, dans les mêmes conditions de charge
+            start = perf_counter()
+            calibration_loop()
+            calibrations.append(perf_counter() - start)
+
+            start = perf_counter()
+            result = func(*args, **kwargs)
+            elapsed = perf_counter() - start
+            if i >= warmup_rounds:
+                timings.append(elapsed)
+
+        # Meilleurs tours (comme timeit) : les moins sensibles à la charge de la machine
+        best = min(timings)
+        relative = best / min(calibrations)
+        self.results[self.name] = float(f"{relative:.4g}")
+
+        if BENCH_SAVE:
+            return result
+
+        baseline = self.baselines.get(self.name)
+        if baseline is None:
+            pytest.skip(
+                f"Pas de baseline pour {self.name} ({best * 1000:.2f} ms, "
+                f"{relative:.3g} x calibration) : lancer avec BENCH_SAVE=1 pour l'enregistrer"
+            )
+
+        limit = baseline * (1 + BENCH_TOLERANCE)
+        assert relative <= limit, (
+            f"Régression de performance sur {self.name} : "
+            f"{relative:.3g} > {limit:.3g} x calibration "
+            f"({best * 1000:.2f} ms, baseline {baseline:.3g}, tolérance {BENCH_TOLERANCE:.0%})"
+        )
+
+        return result
+
+
+@pytest.fixture
+def benchmark(request, bench_results):
+    """
+    Fixture de benchmark : benchmark(func, *args) ou benchmark.pedantic(...)
+    """
+    return Benchmark(request.node.name, bench_results)
@@ -0,0 +1,97 @@
+# tests/benchmarks/test_performance.py
+"""
+Tests de non-régression de performance (CPU, hors ligne, données synthétiques)
+Projet MLOps - Prêt à dépenser
+
+Exclus d'un lancement normal de pytest (addopts dans pyproject.toml).
+Enregistrer les baselines :
+    BENCH_SAVE=1 pytest tests/benchmarks -m benchmark
+Vérifier ensuite :
+    pytest tests/benchmarks -m benchmark
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main
+from monitoring import generate_drift_report, load_logs
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def client(isolated_logs):
+    return TestClient(api.main.app)
+
+
+# Prédiction unitaire (requête HTTP complète, logging inclus)
+def test_bench_predict_single(benchmark, client):
+    response = benchmark.pedantic(client.get, args=("/predict/100001",), rounds=50, warmup_rounds=5)
+    assert response.status_code == 200
+
+
+# Prédiction par lot : pas de route batch, on enchaîne bench_batch appels au modèle
+def test_bench_predict_batch(benchmark, bench_batch):
+    client_ids = list(api.main.clients_db)
+    batch = [client_ids[i % len(client_ids)] for i in range(bench_batch)]
+
+    def predict_batch():
+        return [api.main.dummy_model_predict(cid, api.main.clients_db[cid]) for cid in batch]
+
+    scores = benchmark.pedantic(predict_batch, rounds=10)
+    assert len(scores) == bench_batch
+
+
+# Démarrage à froid : import de api.main dans un nouvel interpréteur, sur un log
+# synthétique isolé (l'histogramme est reconstruit à chaque tour)
+def test_bench_cold_start(benchmark, cold_start_logs_file, tmp_path):
+    logs_file = tmp_path / "logs_production.csv"
+    histogram_file = tmp_path / "score_histogram.json"
+    env = {**os.environ, "LOGS_FILE": str(logs_file)}
+
+    def reset_logs():
+        shutil.copyfile(cold_start_logs_file, logs_file)
+        histogram_file.unlink(missing_ok=True)
+
+    def cold_start():
+        return subprocess.run(
+            [sys.executable, "-c", "import api.main"],
+            cwd=ROOT_DIR,
+            env=env,
+            capture_output=True
+        )
+
+    result = benchmark.pedantic(cold_start, setup=reset_logs, rounds=5, warmup_rounds=1)
+    assert result.returncode == 0, result.stderr.decode()
+    assert histogram_file.exists()
+
+
+# Débit d'écriture des logs
+def test_bench_log_append(benchmark, isolated_logs, bench_batch):
+    def append_batch():
+        for i in range(bench_batch):
+            api.main.log_prediction(str(100001 + i % 10), 0.42, "Crédit accepté", 1.5)
+
+    benchmark.pedantic(append_batch, rounds=10)
+
+    nb_lines = len(isolated_logs.read_text(encoding="utf-8").splitlines())
+    assert nb_lines == 1 + 11 * bench_batch  # en-tête + échauffement + 10 tours
+
+
+# Chargement du log par le dashboard
+def test_bench_dashboard_load_data(benchmark, synthetic_logs_file):
+    df = benchmark.pedantic(load_logs, args=(synthetic_logs_file,), rounds=3)
+    assert df["timestamp"].dtype.kind == "M"
+
+
+# Calcul du data drift (rapport Evidently)
+def test_bench_drift_report(benchmark, synthetic_drift_data, tmp_path):
+    html_path = tmp_path / "drift_report.html"
+    _, path = benchmark.pedantic(generate_drift_report, args=(synthetic_drift_data, html_path), rounds=3)
+    assert path.exists()
@@ -0,0 +1,24 @@
+# tests/conftest.py
+"""
+Fixtures partagées par les tests fonctionnels et les benchmarks
+Projet MLOps - Prêt à dépenser
+"""
+
+import pytest
+
+import api.main
+from api.score_histogram import ScoreHistogram
+
+
+@pytest.fixture
+def isolated_logs(tmp_path, monkeypatch):
+    """
+    Redirige les logs et l'histogramme de l'API vers un dossier temporaire
+    """
+    logs_file = tmp_path / "logs_production.csv"
+    logs_file.write_text("timestamp,client_id,score,decision,response_time_ms\n", encoding="utf-8")
+
+    monkeypatch.setattr(api.main, "LOGS_FILE", logs_file)
+    monkeypatch.setattr(api.main, "HISTOGRAM_FILE", tmp_path / "score_histogram.json")
+    monkeypatch.setattr(api.main, "score_histogram", ScoreHistogram())
+    return logs_file
@@ -4,9 +4,13 @@ Tests automatisés pour l'API de scoring
 Projet MLOps - Prêt à dépenser
 """
 
+import asyncio
 import pytest
+from datetime import date, datetime
 from fastapi.testclient import TestClient
+import api.main
 from api.main import app
+from api.score_histogram import ScoreHistogram
 
 # Création du client de test (simule les requêtes HTTP)
 client = TestClient(app)
@@ -83,4 +87,169 @@ def test_predict_reproducibility():
     # Vérifier que les scores sont identiques
     score1 = response1.json()["score"]
     score2 = response2.json()["score"]
-    assert score1 == score2
\ No newline at end of file
+    assert score1 == score2
+
+# Tests profilage à chaud
+def test_profiling_disabled_by_default():
+    """
+    Test profilage : les routes admin sont invisibles tant que non activées
+    """
+    response = client.get("/admin/profile/cpu", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 404
+
+def test_profiling_requires_admin_token(monkeypatch):
+    """
+    Test profilage : un jeton invalide est refusé
+    """
+    monkeypatch.setattr("api.main.PROFILING_ENABLED", True)
+    monkeypatch.setattr("api.main.PROFILING_TOKEN", "secret")
+
+    response = client.get("/admin/profile/cpu", headers={"X-Admin-Token": "mauvais"})
+    assert response.status_code == 403
+    
+    # En-tête non ASCII (décodé en latin-1 par Starlette) : 403 et non 500
+    response = client.get("/admin/profile/cpu", headers={"X-Admin-Token": b"\xe9t\xe9"})
+    assert response.status_code == 403
+
+def test_profiling_single_session(monkeypatch):
+    """
+    Test profilage : une seule session à la fois (409 si une session est en cours)
+    """
+    monkeypatch.setattr("api.main.PROFILING_ENABLED", True)
+    monkeypatch.setattr("api.main.PROFILING_TOKEN", "secret")
+    headers = {"X-Admin-Token": "secret"}
+    
+    # Simuler une session en cours en prenant le verrou
+    asyncio.run(api.main.profiling_lock.acquire())
+    try:
+        response = client.get("/admin/profile/cpu?duration_s=0.1", headers=headers)
+        assert response.status_code == 409
+        response = client.get("/admin/profile/memory?duration_s=0", headers=headers)
+        assert response.status_code == 409
+    finally:
+        api.main.profiling_lock.release()
+    
+    response = client.get("/admin/profile/memory?duration_s=0", headers=headers)
+    assert response.status_code == 200
+
+def test_profiling_cpu_and_memory(monkeypatch):
+    """
+    Test profilage : sessions CPU (collapsed) et mémoire (top-N) bornées
+    """
+    monkeypatch.setattr("api.main.PROFILING_ENABLED", True)
+    monkeypatch.setattr("api.main.PROFILING_TOKEN", "secret")
+    headers = {"X-Admin-Token": "secret"}
+
+    response = client.get("/admin/profile/cpu?duration_s=0.2&interval_ms=5", headers=headers)
+    assert response.status_code == 200
+    # Format collapsed : "f1;f2;f3 N"
+    first_line = response.text.splitlines()[0]
+    assert first_line.rsplit(" ", 1)[1].isdigit()
+
+    response = client.get("/admin/profile/memory?duration_s=0&top_n=5", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()["top_allocations"]) <= 5
+
+    # Plafond de durée
+    response = client.get("/admin/profile/cpu?duration_s=3600", headers=headers)
+    assert response.status_code == 422
+
+# Tests simulation du seuil
+def test_acceptance_stats_thresholds(isolated_logs):
+    """
+    Test simulation : taux d'acceptation aux seuils extrêmes et seuil appliqué
+    """
+    client.get("/predict/100001")
+    client.get("/predict/100002")
+    
+    response = client.get("/stats/acceptance?threshold=0")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert data["nb_acceptes"] == 0
+    
+    response = client.get("/stats/acceptance?threshold=1")
+    assert response.json()["nb_acceptes"] == 2
+    
+    # Le seuil renvoyé est celui réellement appliqué (résolution 0.01)
+    response = client.get("/stats/acceptance?threshold=0.105")
+    assert response.json()["threshold"] == 0.1
+    
+    # Fenêtre vide : aucune prédiction avant l'an 2000
+    response = client.get("/stats/acceptance?end=1999-12-31")
+    assert response.json()["total"] == 0
+
+def test_score_histogram_window(tmp_path):
+    """
+    Test simulation : fenêtre de dates, seuil et persistance de l'histogramme
+    """
+    histogram = ScoreHistogram()
+    histogram.add(datetime(2025, 10, 1, 9), 0.29)
+    histogram.add(datetime(2025, 10, 2, 9), 0.50)
+    histogram.add(datetime(2025, 10, 3, 9), 0.80)
+    histogram.add(datetime(2025, 10, 3, 9), 1.0)
+    
+    assert histogram.acceptance(0.5)["nb_acceptes"] == 1
+    assert histogram.acceptance(0.51)["nb_acceptes"] == 2
+    assert histogram.acceptance(0.3)["nb_acceptes"] == 1
+    # Score de 1.0 refusé même au seuil 1 (score >= seuil)
+    assert histogram.acceptance(1)["nb_refuses"] == 1
+    
+    window = histogram.acceptance(0.6, date(2025, 10, 2), date(2025, 10, 3))
+    assert window["total"] == 3
+    assert window["nb_acceptes"] == 1
+    
+    path = tmp_path / "score_histogram.json"
+    histogram.save(path)
+    assert ScoreHistogram.load(path).counts() == histogram.counts()
+
+def test_score_histogram_sync(tmp_path):
+    """
+    Test simulation : lecture incrémentale du log et reconstruction si le log change
+    """
+    logs_file = tmp_path / "logs_production.csv"
+    path = tmp_path / "score_histogram.json"
+    header = "timestamp,client_id,score,decision,response_time_ms\n"
+    logs_file.write_text(header + "2025-10-01T09:00:00,100001,0.2,Crédit accepté,1.0\n", encoding="utf-8")
+    
+    histogram = ScoreHistogram.load_synced(path, logs_file)
+    assert histogram.acceptance(0.5)["total"] == 1
+    
+    # Ajout au log : seule la fin est relue, ligne incomplète ignorée
+    with open(logs_file, "a", encoding="utf-8") as f:
+        f.write("2025-10-02T09:00:00,100002,0.8,Crédit refusé,1.0\n2025-10-02T09:0")
+    histogram = ScoreHistogram.load_synced(path, logs_file)
+    assert histogram.acceptance(0.5)["total"] == 2
+    
+    # Log remplacé (rotation) : marqueur différent, reconstruction complète
+    logs_file.write_text(header + "2025-11-01T09:00:00,100003,0.6,Crédit refusé,1.0\n", encoding="utf-8")
+    histogram = ScoreHistogram.load_synced(path, logs_file)
+    assert histogram.acceptance(0.5) == {
+        "threshold": 0.5, "total": 1, "nb_acceptes": 0, "nb_refuses": 1, "taux_acceptation": 0.0
+    }
+
+def test_score_histogram_skips_bad_rows(tmp_path):
+    """
+    Test simulation : une ligne illisible est ignorée, comptée, et ne bloque pas la suite
+    """
+    logs_file = tmp_path / "logs_production.csv"
+    path = tmp_path / "score_histogram.json"
+    logs_file.write_text(
+        "timestamp,client_id,score,decision,response_time_ms\n"
+        "2025-10-01T09:00:00,100001,0.2,Crédit accepté,1.0\n"
+        "garbage,,,\n"
+        "2025-10-02T09:02025-10-03T09:00:00,100002,0.8,Crédit refusé,1.0\n"
+        "2025-10-03T09:00:00,100003,0.7,Crédit refusé,1.0\n",
+        encoding="utf-8"
+    )
+    
+    histogram = ScoreHistogram.load_synced(path, logs_file)
+    assert histogram.acceptance(0.5)["total"] == 2
+    assert histogram.skipped_rows == 2
+    
+    # L'offset a avancé : les lignes suivantes sont bien intégrées
+    with open(logs_file, "a", encoding="utf-8") as f:
+        f.write("2025-10-04T09:00:00,100004,0.3,Crédit accepté,1.0\n")
+    histogram = ScoreHistogram.load_synced(path, logs_file)
+    assert histogram.acceptance(0.5)["total"] == 3
+    assert histogram.skipped_rows == 2